@@ -7,7 +7,7 @@ from typing import List
 from colorama import Fore, Style, init
 from parrot.director.frame import Frame, FrameSignal
 
-from parrot.patch_bay import venue_patches, get_manual_group
+from parrot.patch_bay import PatchBuffer, venue_patches, get_manual_group
 from parrot.fixtures.led_par import Par
 from parrot.fixtures.motionstrip import Motionstrip
 from parrot.fixtures.base import FixtureGroup, ManualGroup
@@ -61,6 +61,9 @@ class Director:
         self.state.events.on_venue_change += lambda s: self.setup_patch()
 
     def setup_patch(self):
+        self.patch_buffer = PatchBuffer(
+            [get_manual_group(self.state.venue)] + venue_patches[self.state.venue]
+        )
         self.group_fixtures()
         self.generate_all()  # Initialize both lighting and VJ
 
@@ -314,11 +317,9 @@ class Director:
         manual_group = get_manual_group(self.state.venue)
         if manual_group:
             manual_group.set_manual_dimmer(self.state.manual_dimmer)
-            manual_group.render(dmx)
 
-        # Render all fixtures
-        for i in venue_patches[self.state.venue]:
-            i.render(dmx)
+        # Render the manual group and all venue fixtures in one pass
+        self.patch_buffer.render(dmx)
 
         dmx.submit()
 
@@ -79,13 +79,15 @@ class TestDirector(unittest.TestCase):
         manual_group = get_manual_group(self.state.venue)
         self.assertIsNotNone(manual_group, "mtn_lotus should have manual fixtures")
         
-        # Spy on the manual group's render method
-        with patch.object(manual_group, 'render', wraps=manual_group.render) as mock_render:
+        # Spy on the manual group's update_values method
+        with patch.object(
+            manual_group, 'update_values', wraps=manual_group.update_values
+        ) as mock_update:
             # Render
             self.director.render(mock_dmx)
             
-            # Verify manual group render was called
-            mock_render.assert_called_once_with(mock_dmx)
+            # Verify manual group was brought up to date for this frame
+            mock_update.assert_called_once_with()
         
         # Verify dmx.submit was called
         mock_dmx.submit.assert_called_once()
@@ -1,21 +1,32 @@
 import logging
+from dataclasses import dataclass
 from typing import List, Optional
+import numpy as np
 from beartype import beartype
 from parrot.utils.colour import Color
-from parrot.utils.dmx_utils import dmx_clamp, Universe
+from parrot.utils.dmx_utils import dmx_clamp, scatter_universe, Universe
 from parrot.utils.string import kebab_case
 
 logger = logging.getLogger(__name__)
 
 
-@beartype
 class FixtureBase:
     def __init__(self, address, name, width, universe=Universe.default):
         self.address = address
         self.name = name
         self.width = width
         self.universe = universe
-        self.values = [0 for i in range(width)]
+        self._id = f"{kebab_case(name)}@{address}:{universe.label}"
+        self.values = np.zeros(width, dtype=np.float64)
+        # Channels past 512 don't exist in the universe, so trim them off once
+        self._safe_width = min(width, max(0, 513 - address))
+        if self._safe_width < width:
+            logger.warning(
+                f"Fixture {name} @ {address} has too many channels, skipping {width - self._safe_width} channels"
+            )
+        # Built on the first render(); the Director renders whole patches
+        # through its own PatchBuffer instead
+        self._patch_buffer = None
         self.color_value = Color("black")
         self.dimmer_value = 0
         self.strobe_value = 0
@@ -23,11 +34,13 @@ class FixtureBase:
         self.x: Optional[int] = None
         self.y: Optional[int] = None
 
+    @beartype
     def set_position(self, x: int, y: int):
         """Set the position of the fixture in the venue (e.g. it's x,y coordinate from the gui rendering)"""
         self.x = x
         self.y = y
 
+    @beartype
     def get_position(self) -> tuple[int, int]:
         """Get the position of the fixture in the venue (e.g. it's x,y coordinate from the gui rendering)"""
         return self.x, self.y
@@ -67,29 +80,24 @@ class FixtureBase:
     def get_speed(self):
         return self.speed_value
 
+    def update_values(self):
+        """Bring self.values up to date for this frame, before they are written out"""
+        pass
+
     def render(self, dmx):
-        # print("-" * 20)
-        for i in range(len(self.values)):
-            # print(f"{self.address + i:03d} = {int(self.values[i])}")
-            if self.address + i > 512:
-                logger.warning(
-                    f"Fixture {self.name} @ {self.address} has too many channels, skipping {i} channels"
-                )
-                break
-            dmx.set_channel(
-                self.address + i, dmx_clamp(self.values[i]), universe=self.universe
-            )
-            dmx.submit()
+        """Write just this fixture's channels (see PatchBuffer)"""
+        if self._patch_buffer is None:
+            self._patch_buffer = PatchBuffer([self], full_frame=False)
+        self._patch_buffer.render(dmx)
 
     def __str__(self) -> str:
         return f"{self.name} @ {self.address}"
 
     @property
     def id(self):
-        return f"{kebab_case(self.name)}@{self.address}:{self.universe.value}"
+        return self._id
 
 
-@beartype
 class FixtureWithBulbs(FixtureBase):
     def __init__(self, address, name, width, bulbs, universe=Universe.default):
         super().__init__(address, name, width, universe)
@@ -114,27 +122,24 @@ class FixtureWithBulbs(FixtureBase):
     def get_bulbs(self) -> List[FixtureBase]:
         return self.bulbs
 
-    def render(self, dmx):
+    def update_values(self):
+        super().update_values()
         for bulb in self.bulbs:
             bulb.render_values(self.values)
-        super().render(dmx)
 
 
-@beartype
+@dataclass(frozen=True, slots=True)
 class ColorWheelEntry:
-    def __init__(self, color: Color, dmx_value: int):
-        self.color = color
-        self.dmx_value = dmx_value
+    color: Color
+    dmx_value: int
 
 
-@beartype
+@dataclass(frozen=True, slots=True)
 class GoboWheelEntry:
-    def __init__(self, gobo: str, dmx_value: int):
-        self.name = gobo
-        self.dmx_value = dmx_value
+    name: str
+    dmx_value: int
 
 
-@beartype
 class FixtureGroup(FixtureBase):
     """A group of fixtures that can be controlled together."""
 
@@ -150,17 +155,23 @@ class FixtureGroup(FixtureBase):
         if not fixtures:
             raise ValueError("FixtureGroup must contain at least one fixture")
 
-        # Use the address of the first fixture as the group address
-        address = min(fixture.address for fixture in fixtures)
-
-        # Calculate total width based on the fixtures
-        width = sum(fixture.width for fixture in fixtures)
+        # Group address is the lowest child address, width is the children's
+        # total width; both gathered in the same pass as the homogeneity check
+        first_type = type(fixtures[0])
+        address = fixtures[0].address
+        width = 0
+        homogeneous = True
+        for fixture in fixtures:
+            if fixture.address < address:
+                address = fixture.address
+            width += fixture.width
+            if homogeneous and not isinstance(fixture, first_type):
+                homogeneous = False
 
         # Generate a name if not provided
         if name is None:
-            fixture_type = type(fixtures[0]).__name__
-            if all(isinstance(f, type(fixtures[0])) for f in fixtures):
-                name = f"{len(fixtures)} {fixture_type}s"
+            if homogeneous:
+                name = f"{len(fixtures)} {first_type.__name__}s"
             else:
                 name = "Mixed Fixture Group"
 
@@ -203,9 +214,9 @@ class FixtureGroup(FixtureBase):
         for fixture in self.fixtures:
             fixture.set_speed(value)
 
-    def render(self, dmx):
+    def update_values(self):
         for fixture in self.fixtures:
-            fixture.render(dmx)
+            fixture.update_values()
 
     def __str__(self) -> str:
         return f"{self.name} @ {self.address} ({len(self.fixtures)} fixtures)"
@@ -220,7 +231,6 @@ class FixtureGroup(FixtureBase):
         return self.fixtures[index]
 
 
-@beartype
 class ManualGroup(FixtureGroup):
     """A group of fixtures that are only controlled manually, not by automatic interpreters."""
 
@@ -238,6 +248,15 @@ class ManualGroup(FixtureGroup):
         super().__init__(fixtures, name, universe)
         self.manual_dimmer = 0
 
+        # Single-channel fixtures are bare dimmers; their channel is a view into
+        # one shared column so the whole set is written with a single fill
+        dimmer_only = [f for f in self.fixtures if f.width == 1]
+        self._width1_values = np.array(
+            [f.values[0] for f in dimmer_only], dtype=np.float64
+        )
+        for index, fixture in enumerate(dimmer_only):
+            fixture.values = self._width1_values[index : index + 1]
+
         # Set the parent_group attribute on all fixtures and default to white
         for fixture in self.fixtures:
             fixture.parent_group = self
@@ -253,27 +272,118 @@ class ManualGroup(FixtureGroup):
         self.manual_dimmer = value
         # Convert 0-1 range to 0-255 range for fixtures
         dimmer_255 = value * 255
-        self.dimmer_value = dimmer_255
-
-        for fixture in self.fixtures:
-            # Set the dimmer value for each fixture (0-255 range)
-            fixture.set_dimmer(dimmer_255)
-            # For simple fixtures with just a dimmer channel, set the value directly
-            if fixture.width == 1:
-                fixture.values[0] = int(dimmer_255)
+        # Each fixture's own set_dimmer maps the value onto its channels
+        self.set_dimmer(dimmer_255)
+        self._width1_values.fill(dmx_clamp(dimmer_255))
 
     def get_dimmer(self):
         """Override to return the manual dimmer value in 0-255 range."""
         return self.manual_dimmer * 255
 
-    def render(self, dmx):
+    def update_values(self):
         """Override to ensure manual dimmer value is applied before rendering."""
         # Apply the manual dimmer value to all fixtures (convert 0-1 to 0-255)
         dimmer_255 = self.manual_dimmer * 255
         for fixture in self.fixtures:
             fixture.dimmer_value = dimmer_255
-            if fixture.width == 1:
-                fixture.values[0] = int(dimmer_255)
+        self._width1_values.fill(dmx_clamp(dimmer_255))
+
+        # Call the parent update method
+        super().update_values()
+
+
+def _flatten_fixtures(fixtures):
+    for fixture in fixtures:
+        if isinstance(fixture, FixtureGroup):
+            yield from _flatten_fixtures(fixture.fixtures)
+        else:
+            yield fixture
+
+
+class PatchBuffer:
+    """Renders a whole patch to DMX in one vectorized pass.
+
+    Every fixture's channel values are gathered into one flat array each frame,
+    then clamped and scattered into a 512-channel frame per universe using
+    index arrays computed once from the patch's addresses and widths.
+
+    With full_frame=False each fixture's own channels are written instead of
+    whole frames, so a fixture rendered on its own leaves its neighbours alone.
+    """
+
+    def __init__(self, fixtures, full_frame=True):
+        self.fixtures = [f for f in fixtures if f is not None]
+        self._leaves = list(_flatten_fixtures(self.fixtures))
+        self._full_frame = full_frame
+
+        self.addresses = np.array([f.address for f in self._leaves], dtype=np.int32)
+        self.widths = np.array([f.width for f in self._leaves], dtype=np.int32)
+        self.value_offsets = np.zeros(len(self._leaves), dtype=np.int32)
+        if len(self._leaves) > 1:
+            np.cumsum(self.widths[:-1], out=self.value_offsets[1:])
+        self.values_flat = np.zeros(int(self.widths.sum()), dtype=np.float64)
+        self._written_values = np.zeros_like(self.values_flat)
+        self._written_to = None
+
+        if not full_frame:
+            # (address, offset into values_flat, in-universe width, universe)
+            self._dmx_flat = np.zeros(len(self.values_flat), dtype=np.uint8)
+            self._spans = [
+                (f.address, int(offset), f._safe_width, f.universe)
+                for f, offset in zip(self._leaves, self.value_offsets)
+                if f._safe_width > 0
+            ]
+            return
+
+        # Per universe: (frame, flat indices to read, 0-based channels to write)
+        self._universes = {}
+        for index, fixture in enumerate(self._leaves):
+            offset = self.value_offsets[index]
+            channels = np.arange(fixture.width) + fixture.address - 1
+            in_range = channels < 512
+            sources, targets = self._universes.setdefault(fixture.universe, ([], []))
+            sources.append(np.arange(fixture.width)[in_range] + offset)
+            targets.append(channels[in_range])
+        self._universes = {
+            universe: (
+                np.zeros(512, dtype=np.uint8),
+                np.concatenate(sources).astype(np.intp),
+                np.concatenate(targets).astype(np.intp),
+            )
+            for universe, (sources, targets) in self._universes.items()
+        }
 
-        # Call the parent render method
-        super().render(dmx)
+    def render(self, dmx):
+        for fixture in self.fixtures:
+            fixture.update_values()
+
+        if not self._leaves:
+            return
+        np.concatenate([f.values for f in self._leaves], out=self.values_flat)
+        # The controller keeps the previous frame, so skip idle frames entirely
+        if dmx is self._written_to and np.array_equal(
+            self.values_flat, self._written_values
+        ):
+            return
+        np.copyto(self._written_values, self.values_flat)
+        self._written_to = dmx
+
+        if not self._full_frame:
+            self._write_spans(dmx)
+            return
+        for universe, (frame, sources, targets) in self._universes.items():
+            scatter_universe(self.values_flat, sources, targets, frame)
+            dmx.set_channels(1, frame, universe=universe)
+
+    def _write_spans(self, dmx):
+        np.clip(self.values_flat, 0, 255, out=self.values_flat)
+        np.nan_to_num(self.values_flat, copy=False)
+        np.copyto(self._dmx_flat, self.values_flat, casting="unsafe")
+        for address, offset, count, universe in self._spans:
+            # Single-channel fixtures (dimmers, house lights) skip the slice
+            if count == 1:
+                dmx.set_channel(address, int(self._dmx_flat[offset]), universe=universe)
+            else:
+                dmx.set_channels(
+                    address, self._dmx_flat[offset : offset + count], universe=universe
+                )
@@ -17,9 +17,12 @@ class ColorBandPixZone(FixtureBase):
         parent_dimmer = self.parent.get_dimmer()
         c = dim_color(self.get_color(), self.get_dimmer() / 255 * parent_dimmer / 255)
 
-        values[self.address + 0] = int(c.red * 255)  # Red
-        values[self.address + 1] = int(c.green * 255)  # Green
-        values[self.address + 2] = int(c.blue * 255)  # Blue
+        red, green, blue = c.rgb
+        values[self.address : self.address + 3] = (
+            int(red * 255),
+            int(green * 255),
+            int(blue * 255),
+        )
 
 
 class ChauvetColorBandPiX_36Ch(FixtureWithBulbs):
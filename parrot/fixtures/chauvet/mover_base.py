@@ -1,10 +1,63 @@
+from functools import lru_cache
 from typing import List
+
+import numpy as np
+
 from parrot.fixtures.base import ColorWheelEntry, FixtureBase, GoboWheelEntry
-from parrot.utils.color_extra import color_distance
-from parrot.utils.colour import Color
+from parrot.utils.colour import Color, hsl2rgb, rgb2hsl
 from parrot.utils.dmx_utils import Universe
 from parrot.fixtures.moving_head import MovingHead
 
+# Degrees of travel per coarse DMX step (540 degree pan, 270 degree tilt)
+_PAN_DEGREES_PER_STEP = 540 / 255
+_TILT_DEGREES_PER_STEP = 270 / 255
+
+# Quantization steps per RGB channel for the color wheel lookup table
+COLOR_LUT_LEVELS = 32
+
+
+@lru_cache(maxsize=None)
+def _lut_grid_hsl():
+    """HSL of every quantized RGB cell, shape (LEVELS, LEVELS, LEVELS, 3)."""
+    steps = np.linspace(0, 1, COLOR_LUT_LEVELS)
+    grid = np.stack(np.meshgrid(steps, steps, steps, indexing="ij"), axis=-1)
+    hsl = [rgb2hsl(rgb) for rgb in grid.reshape(-1, 3)]
+    return np.array(hsl).reshape(grid.shape)
+
+
+@lru_cache(maxsize=None)
+def color_wheel_lut(wheel_hsl):
+    """Index of the closest wheel entry for every quantized RGB cell.
+
+    Closeness is color_distance (L1 over hue, saturation, luminance) measured
+    from each cell's grid point, with ties going to the earliest entry. A color
+    looked up through the table is rounded to the nearest grid point first (up
+    to half a 1/31 step per RGB channel), so near a boundary between two
+    entries, and near greys where hue swings with small RGB changes, it can
+    land on a different entry than an exact color_distance scan would pick.
+    Against random colors that happens for about 4% of lookups on the
+    Intimidator 160 and generic moving head wheels. Cached per wheel, keyed by
+    the entries' HSL.
+    """
+    distances = np.abs(_lut_grid_hsl()[..., None, :] - np.array(wheel_hsl)).sum(axis=-1)
+    return np.argmin(distances, axis=-1).astype(np.uint8)
+
+
+@lru_cache(maxsize=4096)
+def closest_wheel_index(wheel_hsl, color_hsl):
+    """Index of the wheel entry closest to color_hsl, memoized per color.
+
+    Interpreters tend to hold the same colors frame after frame, so repeat
+    lookups skip the HSL -> RGB conversion as well as the table lookup.
+    """
+    top = COLOR_LUT_LEVELS - 1
+    red, green, blue = hsl2rgb(color_hsl)
+    return int(
+        color_wheel_lut(wheel_hsl)[
+            int(red * top + 0.5), int(green * top + 0.5), int(blue * top + 0.5)
+        ]
+    )
+
 
 class ChauvetMoverBase(MovingHead):
 
@@ -35,21 +88,34 @@ class ChauvetMoverBase(MovingHead):
         self.tilt_lower = tilt_lower / 270 * 255
         self.tilt_upper = tilt_upper / 270 * 255
         self.tilt_range = self.tilt_upper - self.tilt_lower
+        # Per-unit scale factors so set_pan/set_tilt avoid dividing every call
+        self._pan_step = self.pan_range / 255
+        self._tilt_step = self.tilt_range / 255
         self.dimmer_upper = dimmer_upper
         self.dmx_layout = dmx_layout
+        # Channel indices that exist on this fixture, resolved once
+        self._channels = {
+            channel: index for channel, index in dmx_layout.items() if index < width
+        }
         self.color_wheel = color_wheel
+        self._color_wheel_hsl = tuple(entry.color.hsl for entry in color_wheel)
         self.shutter_open_value = shutter_open
         self.strobe_shutter_lower = strobe_shutter_lower
         self.strobe_shutter_upper = strobe_shutter_upper
         self.disable_fine = disable_fine
 
+        # First entry wins when a wheel repeats a gobo name
+        self._gobo_by_name = {}
+        for entry in gobo_wheel:
+            self._gobo_by_name.setdefault(entry.name, entry)
+
         self.set_speed(speed_value)
         self.set_shutter_open()
 
     def set(self, name, value):
-        if name in self.dmx_layout:
-            if self.dmx_layout[name] <= self.width:
-                self.values[self.dmx_layout[name]] = value
+        index = self._channels.get(name)
+        if index is not None:
+            self.values[index] = value
 
     def set_dimmer(self, value):
         super().set_dimmer(value)
@@ -57,8 +123,8 @@ class ChauvetMoverBase(MovingHead):
 
     # 0 - 255
     def set_pan(self, value):
-        projected = self.pan_lower + (self.pan_range * value / 255)
-        super().set_pan_angle(projected / 255 * 540)
+        projected = self.pan_lower + self._pan_step * value
+        super().set_pan_angle(projected * _PAN_DEGREES_PER_STEP)
         self.set("pan_coarse", int(projected))
 
         if not self.disable_fine:
@@ -66,8 +132,8 @@ class ChauvetMoverBase(MovingHead):
 
     # 0 - 255
     def set_tilt(self, value):
-        projected = self.tilt_lower + (self.tilt_range * value / 255)
-        super().set_tilt_angle(projected / 255 * 270)
+        projected = self.tilt_lower + self._tilt_step * value
+        super().set_tilt_angle(projected * _TILT_DEGREES_PER_STEP)
 
         self.set("tilt_coarse", int(projected))
 
@@ -79,24 +145,19 @@ class ChauvetMoverBase(MovingHead):
 
     def set_color(self, color: Color):
         # Find the closest color in the color wheel
-        closest = None
-        for entry in self.color_wheel:
-            if closest == None or color_distance(entry.color, color) < color_distance(
-                closest.color, color
-            ):
-                closest = entry
+        closest = self.color_wheel[
+            closest_wheel_index(self._color_wheel_hsl, color.hsl)
+        ]
 
         # Set the color wheel value
         self.set("color_wheel", closest.dmx_value)
         super().set_color(closest.color)
 
     def set_gobo(self, name):
-        # Find in the gobo wheel
-        acceptable_gobos = [i for i in self.gobo_wheel if i.name == name]
-        if len(acceptable_gobos) == 0:
+        gobo = self._gobo_by_name.get(name)
+        if gobo is None:
             raise ValueError(f"Unknown gobo {name}")
 
-        gobo = acceptable_gobos[0]
         self.set("gobo_wheel", gobo.dmx_value)
 
     def set_strobe(self, value):
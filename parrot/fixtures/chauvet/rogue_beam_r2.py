@@ -114,7 +114,7 @@ class ChauvetRogueBeamR2(ChauvetMoverBase):
         self._startup_sequence_complete = False
         self._startup_sequence_start_time = None
 
-    def render(self, dmx):
+    def update_values(self):
         # Handle startup sequence
         if not self._startup_sequence_complete:
             current_time = time.time()
@@ -134,5 +134,5 @@ class ChauvetRogueBeamR2(ChauvetMoverBase):
                 self._startup_sequence_complete = True
                 self.set("control", 0)
 
-        # Call the base render function
-        super().render(dmx)
+        # Call the base update function
+        super().update_values()
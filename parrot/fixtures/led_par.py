@@ -1,16 +1,13 @@
-from beartype import beartype
 from parrot.utils.color_extra import color_to_rgbw, render_color_components
 from parrot.utils.colour import Color
 from parrot.utils.dmx_utils import Universe
 from .base import FixtureBase
 
 
-@beartype
 class Par(FixtureBase):
     pass
 
 
-@beartype
 class ParRGB(Par):
     "David's Par RGB fixture"
 
@@ -36,7 +33,6 @@ class ParRGB(Par):
         pass
 
 
-@beartype
 class ParRGBAWU(Par):
     "Mountain Lotus Par fixture"
 
@@ -29,8 +29,7 @@ class MotionstripBulb(FixtureBase):
 
     def render_values(self, values):
         c = color_to_rgbw(dim_color(self.get_color(), self.get_dimmer() / 255))
-        for i in range(4):
-            values[self.address + i] = c[i]
+        values[self.address : self.address + 4] = c
 
 
 class Motionstrip(FixtureWithBulbs):
@@ -83,7 +82,7 @@ class Motionstrip38(Motionstrip):
         # Even speed 255 is pretty slow, so we render our own strobe in the dimmer
         # self.values[5] = super().get_strobe()
 
-    def render(self, dmx):
+    def update_values(self):
         if self.get_strobe() > 0:
             self.values[4] = 255 * math.sin(time.time() * 30)
-        super().render(dmx)
+        super().update_values()
@@ -1,5 +1,4 @@
 from typing import List
-from beartype import beartype
 from parrot.fixtures.base import ColorWheelEntry, GoboWheelEntry
 from parrot.fixtures.chauvet.mover_base import ChauvetMoverBase
 from parrot.utils.colour import Color
@@ -44,7 +43,6 @@ gobo_wheel: List[GoboWheelEntry] = [
     GoboWheelEntry("flower", 136),
 ]
 
-@beartype
 class GenericChineseMovingHead10ch(ChauvetMoverBase):
 
     SUPPORTS_PAN_FINE = False
@@ -54,6 +52,8 @@ class GenericChineseMovingHead10ch(ChauvetMoverBase):
     PAN_RANGE = (0, 255)
     TILT_RANGE = (0, 255)
 
+    _STROBE_IDX = dmx_layout["strobe"]
+
 
     def __init__(self, patch, universe=Universe.default, name="Generic Chinese 10ch"):
         super().__init__(
@@ -68,4 +68,4 @@ class GenericChineseMovingHead10ch(ChauvetMoverBase):
         )
 
     def set_strobe(self, value):
-        self.set("strobe", value)
+        self.values[self._STROBE_IDX] = value
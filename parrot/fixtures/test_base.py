@@ -1,5 +1,6 @@
 import pytest
 from unittest.mock import MagicMock
+from parrot.fixtures.led_par import ParRGB
 from parrot.fixtures.base import (
     FixtureBase,
     FixtureWithBulbs,
@@ -90,9 +91,50 @@ class TestFixtureBase:
         dmx = MagicMock()
         self.fixture.values = [100, 150, 200]
         self.fixture.render(dmx)
-        dmx.set_channel.assert_any_call(1, 100)
-        dmx.set_channel.assert_any_call(2, 150)
-        dmx.set_channel.assert_any_call(3, 200)
+        dmx.set_channels.assert_called_once()
+        start, values = dmx.set_channels.call_args.args
+        assert start == 1
+        assert list(values) == [100, 150, 200]
+        dmx.submit.assert_not_called()
+
+    def test_render_clamps_values(self):
+        """Test that render clamps out-of-range and NaN values"""
+        dmx = MagicMock()
+        self.fixture.values[0] = -20
+        self.fixture.values[1] = 300.7
+        self.fixture.values[2] = float("nan")
+        self.fixture.render(dmx)
+        _, values = dmx.set_channels.call_args.args
+        assert list(values) == [0, 255, 0]
+
+    def test_render_single_channel_fast_path(self):
+        """Test that width-1 fixtures write one clamped channel"""
+        dmx = MagicMock()
+        fixture = FixtureBase(address=40, name="Dimmer", width=1)
+        fixture.values[0] = 300
+        fixture.render(dmx)
+        dmx.set_channel.assert_called_once_with(40, 255, universe=fixture.universe)
+        dmx.set_channels.assert_not_called()
+
+        fixture.values[0] = float("nan")
+        fixture.render(dmx)
+        dmx.set_channel.assert_called_with(40, 0, universe=fixture.universe)
+
+    def test_render_skips_unchanged_values(self):
+        """Test that render only writes when values change or the controller does"""
+        dmx = MagicMock()
+        self.fixture.values[0] = 10
+        self.fixture.render(dmx)
+        self.fixture.render(dmx)
+        assert dmx.set_channels.call_count == 1
+
+        self.fixture.values[0] = 20
+        self.fixture.render(dmx)
+        assert dmx.set_channels.call_count == 2
+
+        other = MagicMock()
+        self.fixture.render(other)
+        assert other.set_channels.call_count == 1
 
     def test_render_channel_limit(self):
         """Test that render respects DMX channel limit"""
@@ -103,9 +145,21 @@ class TestFixtureBase:
         fixture.render(dmx)
 
         # Should only set channels up to 512
-        dmx.set_channel.assert_any_call(511, 100)
-        dmx.set_channel.assert_any_call(512, 150)
-        # Channels 513+ should not be called
+        start, values = dmx.set_channels.call_args.args
+        assert start == 511
+        # Channels 513+ should not be written
+        assert list(values) == [100, 150]
+
+    def test_channel_limit_warns_once(self, caplog):
+        """Test that the channel overflow is reported at construction, not per render"""
+        fixture = FixtureBase(address=511, name="Test", width=5)
+        assert "too many channels" in caplog.text
+
+        caplog.clear()
+        fixture.render(MagicMock())
+        fixture.values[0] = 1
+        fixture.render(MagicMock())
+        assert "too many channels" not in caplog.text
 
     def test_id_property(self):
         """Test the ID property"""
@@ -209,6 +263,21 @@ class TestFixtureGroup:
         assert self.fixture1.get_strobe() == 100
         assert self.fixture2.get_strobe() == 100
 
+    def test_group_setters_call_child_setters(self):
+        """Test that group-wide setters go straight through each child's setters"""
+
+        class DimmerChannelFixture(FixtureBase):
+            def set_dimmer(self, value):
+                super().set_dimmer(value)
+                self.values[0] = value
+
+        child = DimmerChannelFixture(address=7, name="Child", width=1)
+        group = FixtureGroup([child])
+
+        group.set_dimmer(50)
+        assert child.get_dimmer() == 50
+        assert child.values[0] == 50
+
     def test_pan_tilt_speed_setting(self):
         """Test that pan, tilt, and speed settings affect all fixtures"""
         self.group.set_pan(128)
@@ -298,6 +367,23 @@ class TestManualGroup:
         assert self.fixture1.values[0] == 153
         assert self.fixture2.values[0] == 153
 
+    def test_manual_dimmer_reaches_multichannel_fixtures_on_render(self):
+        """Test that fixtures wider than one channel get the dimmer via their setter"""
+        par = ParRGB(patch=10)
+        group = ManualGroup([self.fixture1, par])
+        group.set_manual_dimmer(0.4)
+        group.render(MagicMock())
+        assert par.values[0] == 102
+        assert self.fixture1.values[0] == 102
+
+    def test_manual_dimmer_channel_stays_in_dmx_range(self):
+        """Test that out-of-range manual dimmer values are clamped to a DMX byte"""
+        self.group.set_manual_dimmer(1.5)
+        assert self.fixture1.values[0] == 255
+
+        self.group.set_manual_dimmer(-0.5)
+        assert self.fixture1.values[0] == 0
+
 
 class TestColorWheelEntry:
     def test_initialization(self):
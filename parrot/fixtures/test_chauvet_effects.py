@@ -66,8 +66,9 @@ class TestChauvetDerby:
         self.derby.values = [10, 20, 30, 40, 50, 60]
         self.derby.render(self.dmx)
 
-        for i in range(6):
-            self.dmx.set_channel.assert_any_call(10 + i, (i + 1) * 10)
+        start, values = self.dmx.set_channels.call_args.args
+        assert start == 10
+        assert list(values) == [(i + 1) * 10 for i in range(6)]
 
 
 class TestRotosphereBulb:
@@ -167,7 +168,8 @@ class TestChauvetRotosphere_28Ch:
         self.rotosphere.render(self.dmx)
 
         # Should call DMX for all 28 channels
-        assert self.dmx.set_channel.call_count == 28
+        _, values = self.dmx.set_channels.call_args.args
+        assert len(values) == 28
 
 
 class TestColorBandPixZone:
@@ -261,7 +263,8 @@ class TestChauvetColorBandPiX_36Ch:
         self.colorband.render(self.dmx)
 
         # Should call DMX for all 36 channels
-        assert self.dmx.set_channel.call_count == 36
+        _, values = self.dmx.set_channels.call_args.args
+        assert len(values) == 36
 
     def test_channel_mapping(self):
         """Test that channels map correctly to zones"""
@@ -277,7 +280,8 @@ class TestChauvetColorBandPiX_36Ch:
 
         # Verify calls were made for all channels
         expected_calls = 36
-        assert self.dmx.set_channel.call_count == expected_calls
+        _, values = self.dmx.set_channels.call_args.args
+        assert len(values) == expected_calls
 
 
 class TestChauvetGigbarLaser:
@@ -320,11 +324,15 @@ class TestChauvetGigbarLaser:
         self.laser.set_dimmer(255)
         self.laser.render(self.dmx)
 
-        self.dmx.set_channel.assert_called_with(25, 6)
+        self.dmx.set_channel.assert_called_with(
+            25, 6, universe=self.laser.universe
+        )
 
     def test_render_off(self):
         """Test render method when off"""
         self.laser.set_dimmer(0)
         self.laser.render(self.dmx)
 
-        self.dmx.set_channel.assert_called_with(25, 0)
+        self.dmx.set_channel.assert_called_with(
+            25, 0, universe=self.laser.universe
+        )
@@ -8,6 +8,7 @@ from parrot.fixtures.chauvet.move9 import ChauvetMove_9Ch
 from parrot.fixtures.chauvet.rogue_beam_r2 import ChauvetRogueBeamR2
 from parrot.fixtures.base import ColorWheelEntry, GoboWheelEntry
 from parrot.utils.colour import Color
+from parrot.utils.color_extra import color_distance
 
 
 class TestChauvetMoverBase:
@@ -93,7 +94,7 @@ class TestChauvetMoverBase:
 
         # Check pan angle is set
         expected_angle = expected_projected / 255 * 540
-        assert self.mover.get_pan_angle() == expected_angle
+        assert self.mover.get_pan_angle() == pytest.approx(expected_angle)
 
     def test_set_tilt(self):
         """Test tilt setting"""
@@ -105,7 +106,7 @@ class TestChauvetMoverBase:
 
         # Check tilt angle is set
         expected_angle = expected_projected / 255 * 270
-        assert self.mover.get_tilt_angle() == expected_angle
+        assert self.mover.get_tilt_angle() == pytest.approx(expected_angle)
 
     def test_set_speed(self):
         """Test speed setting"""
@@ -124,6 +125,30 @@ class TestChauvetMoverBase:
             "red"
         )  # Should be set to exact wheel color
 
+    def test_set_color_wheel_entries_map_to_themselves(self):
+        """Test every wheel color resolves to its own entry"""
+        for entry in self.color_wheel:
+            self.mover.set_color(entry.color)
+            assert self.mover.values[5] == entry.dmx_value
+
+    def test_set_color_near_match(self):
+        """Test a color near a wheel entry resolves to that entry"""
+        self.mover.set_color(Color(rgb=(0.9, 0.1, 0.1)))
+        assert self.mover.values[5] == 50
+
+    def test_set_ignores_channels_past_width(self):
+        """Test that layout channels beyond the fixture width are skipped"""
+        mover = ChauvetMoverBase(
+            patch=1,
+            name="Narrow Mover",
+            width=9,
+            dmx_layout={**self.dmx_layout, "extra": 9},
+            color_wheel=self.color_wheel,
+            gobo_wheel=self.gobo_wheel,
+        )
+        mover.set("extra", 100)
+        assert len(mover.values) == 9
+
     def test_set_gobo_valid(self):
         """Test setting a valid gobo"""
         self.mover.set_gobo("dots")
@@ -227,6 +252,21 @@ class TestChauvetSpot160_12Ch:
         assert self.spot.pan_lower == expected_lower
         assert self.spot.pan_upper == expected_upper
 
+    @pytest.mark.parametrize(
+        "rgb",
+        [(0.23, 0.31, 0.87), (0.95, 0.52, 0.07), (0.12, 0.8, 0.33), (0.6, 0.1, 0.7)],
+    )
+    def test_off_grid_color_matches_exact_scan(self, rgb):
+        """Test off-grid colors away from entry boundaries match an exact scan"""
+        color = Color(rgb=rgb)
+        expected = min(
+            self.spot.color_wheel, key=lambda entry: color_distance(color, entry.color)
+        )
+        self.spot.set_color(color)
+        assert (
+            self.spot.values[self.spot.dmx_layout["color_wheel"]] == expected.dmx_value
+        )
+
 
 class TestChauvetMove_9Ch:
     def setup_method(self):
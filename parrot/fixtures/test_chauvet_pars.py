@@ -64,8 +64,9 @@ class TestChauvetParRGBAWU:
         self.par.values = [10, 20, 30, 40, 50, 60, 70]
         self.par.render(self.dmx)
 
-        for i in range(7):
-            self.dmx.set_channel.assert_any_call(10 + i, (i + 1) * 10)
+        start, values = self.dmx.set_channels.call_args.args
+        assert start == 10
+        assert list(values) == [(i + 1) * 10 for i in range(7)]
 
 
 class TestChauvetSlimParProQ_5Ch:
@@ -132,8 +133,9 @@ class TestChauvetSlimParProQ_5Ch:
         self.par.values = [50, 100, 150, 200, 250]
         self.par.render(self.dmx)
 
-        for i in range(5):
-            self.dmx.set_channel.assert_any_call(15 + i, 50 + i * 50)
+        start, values = self.dmx.set_channels.call_args.args
+        assert start == 15
+        assert list(values) == [50 + i * 50 for i in range(5)]
 
 
 class TestChauvetSlimParProH_7Ch:
@@ -227,5 +229,6 @@ class TestChauvetSlimParProH_7Ch:
         self.par.values = [10, 20, 30, 40, 50, 60, 70]
         self.par.render(self.dmx)
 
-        for i in range(7):
-            self.dmx.set_channel.assert_any_call(20 + i, (i + 1) * 10)
+        start, values = self.dmx.set_channels.call_args.args
+        assert start == 20
+        assert list(values) == [(i + 1) * 10 for i in range(7)]
@@ -60,8 +60,9 @@ class TestTwoBeamLaser:
         self.laser.render(self.dmx)
 
         # Verify all channels are set
-        for i in range(10):
-            self.dmx.set_channel.assert_any_call(1 + i, i + 1)
+        start, values = self.dmx.set_channels.call_args.args
+        assert start == 1
+        assert list(values) == [i + 1 for i in range(10)]
 
 
 class TestFiveBeamLaser:
@@ -115,8 +116,9 @@ class TestFiveBeamLaser:
         self.laser.render(self.dmx)
 
         # Verify all channels are set
-        for i in range(13):
-            self.dmx.set_channel.assert_any_call(5 + i, i)
+        start, values = self.dmx.set_channels.call_args.args
+        assert start == 5
+        assert list(values) == list(range(13))
 
 
 class TestChauvetGigbarLaser:
@@ -146,4 +148,4 @@ class TestChauvetGigbarLaser:
         """Test that render calls DMX correctly"""
         self.laser.set_dimmer(255)
         self.laser.render(self.dmx)
-        self.dmx.set_channel.assert_called_with(20, 6)
+        self.dmx.set_channel.assert_called_with(20, 6, universe=self.laser.universe)
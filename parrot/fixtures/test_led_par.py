@@ -61,10 +61,10 @@ class TestParRGB:
         self.par.values = [10, 20, 30, 40, 50, 60, 70]
         self.par.render(self.dmx)
 
-        for i in range(7):
-            self.dmx.set_channel.assert_any_call(
-                1 + i, (i + 1) * 10, universe=Universe.default
-            )
+        start, values = self.dmx.set_channels.call_args.args
+        assert start == 1
+        assert list(values) == [(i + 1) * 10 for i in range(7)]
+        assert self.dmx.set_channels.call_args.kwargs["universe"] == Universe.default
 
 
 class TestParRGBAWU:
@@ -139,7 +139,7 @@ class TestParRGBAWU:
         self.par.values = [10, 20, 30, 40, 50, 60, 70, 80, 90]
         self.par.render(self.dmx)
 
-        for i in range(9):
-            self.dmx.set_channel.assert_any_call(
-                1 + i, (i + 1) * 10, universe=Universe.default
-            )
+        start, values = self.dmx.set_channels.call_args.args
+        assert start == 1
+        assert list(values) == [(i + 1) * 10 for i in range(9)]
+        assert self.dmx.set_channels.call_args.kwargs["universe"] == Universe.default
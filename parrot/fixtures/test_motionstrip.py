@@ -167,10 +167,10 @@ class TestMotionstrip38:
         assert self.motionstrip.values[4] == 150
 
         # Verify DMX calls
-        for i in range(38):
-            self.dmx.set_channel.assert_any_call(
-                1 + i, self.motionstrip.values[i], universe=Universe.default
-            )
+        start, values = self.dmx.set_channels.call_args.args
+        assert start == 1
+        assert list(values) == [self.motionstrip.values[i] for i in range(38)]
+        assert self.dmx.set_channels.call_args.kwargs["universe"] == Universe.default
 
     def test_pan_range_calculation(self):
         """Test pan range calculation"""
@@ -66,8 +66,9 @@ class TestMovingHead:
         self.moving_head.render(self.dmx)
 
         # Verify all channels are set
-        for i in range(8):
-            self.dmx.set_channel.assert_any_call(10 + i, (i + 1) * 10)
+        start, values = self.dmx.set_channels.call_args.args
+        assert start == 10
+        assert list(values) == [(i + 1) * 10 for i in range(8)]
 
     def test_position_setting(self):
         """Test position setting and getting"""
@@ -1,6 +1,7 @@
 import enum
+from collections.abc import Mapping
 
-from parrot.fixtures.base import FixtureGroup, ManualGroup
+from parrot.fixtures.base import FixtureGroup, ManualGroup, PatchBuffer
 from parrot.fixtures.chauvet.intimidator110 import ChauvetSpot110_12Ch
 from parrot.fixtures.chauvet.intimidator160 import ChauvetSpot160_12Ch
 from parrot.fixtures.led_par import ParRGB, ParRGBAWU
@@ -67,25 +68,63 @@ def _crux_patch():
     ]
 
 
-venue_patches = {
-    venues.dmack: _dmack_patch(),
-    venues.mtn_lotus: _mtn_lotus_patch(),
-    venues.truckee_theatre: _truckee_patch(),
-    venues.crux_test: _crux_patch(),
-    venues.two_heads_only: _two_heads_only(),
-}
-
-manual_groups = {
-    venues.dmack: None,
-    venues.mtn_lotus: ManualGroup(
+def _mtn_lotus_manual():
+    return ManualGroup(
         [ParRGBAWU(patch=200), ParRGB(patch=220)], name="Mountain Lotus Manual"
-    ),
-    venues.truckee_theatre: ManualGroup(
-        [ParRGB(patch=240), ParRGB(patch=260)], name="Truckee Manual"
-    ),
-    venues.crux_test: None,
-    venues.two_heads_only: None,
-}
+    )
+
+
+def _truckee_manual():
+    return ManualGroup([ParRGB(patch=240), ParRGB(patch=260)], name="Truckee Manual")
+
+
+class _LazyVenueMap(Mapping):
+    """Maps venue -> value, calling the venue's factory on first access only.
+
+    Building a venue's fixtures allocates their state, so venues that are never
+    selected in a run are never constructed.
+    """
+
+    def __init__(self, factories):
+        self._factories = factories
+        self._built = {}
+
+    def __getitem__(self, venue):
+        if venue not in self._built:
+            factory = self._factories[venue]
+            self._built[venue] = factory() if factory is not None else None
+        return self._built[venue]
+
+    def __iter__(self):
+        return iter(self._factories)
+
+    def __len__(self):
+        return len(self._factories)
+
+
+venue_patches = _LazyVenueMap(
+    {
+        venues.dmack: _dmack_patch,
+        venues.mtn_lotus: _mtn_lotus_patch,
+        venues.truckee_theatre: _truckee_patch,
+        venues.crux_test: _crux_patch,
+        venues.two_heads_only: _two_heads_only,
+    }
+)
+
+manual_groups = _LazyVenueMap(
+    {
+        venues.dmack: None,
+        venues.mtn_lotus: _mtn_lotus_manual,
+        venues.truckee_theatre: _truckee_manual,
+        venues.crux_test: None,
+        venues.two_heads_only: None,
+    }
+)
+
+
+def get_patch(venue):
+    return venue_patches[venue]
 
 
 def get_manual_group(venue):
@@ -5,8 +5,12 @@ from parrot.patch_bay import (
     manual_groups,
     get_manual_group,
     has_manual_dimmer,
+    get_patch,
+    PatchBuffer,
+    _LazyVenueMap,
 )
 from parrot.fixtures.base import FixtureBase, FixtureGroup, ManualGroup
+from unittest.mock import MagicMock
 
 
 class TestPatchBay:
@@ -163,3 +167,106 @@ class TestPatchBay:
                 print(f"Warning: Found address conflicts in {venue.name}: {conflicts}")
                 # Uncomment the line below to make this test strict:
                 # assert False, f"Address conflicts found: {conflicts}"
+
+    def test_get_patch_returns_same_fixtures(self):
+        """Test that a venue's fixtures are built once and reused."""
+        assert get_patch(venues.dmack) is venue_patches[venues.dmack]
+        assert get_patch(venues.dmack) is get_patch(venues.dmack)
+
+    def test_lazy_venue_map_builds_on_first_access(self):
+        """Test that venue factories only run when their venue is requested."""
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return ["fixture"]
+
+        patches = _LazyVenueMap({venues.dmack: factory, venues.crux_test: None})
+        assert calls == []
+        assert list(patches) == [venues.dmack, venues.crux_test]
+
+        assert patches[venues.dmack] == ["fixture"]
+        assert patches[venues.dmack] == ["fixture"]
+        assert calls == [1]
+        assert patches.get(venues.crux_test) is None
+
+
+class TestPatchBuffer:
+    def test_render_writes_one_frame_per_universe(self):
+        """All fixtures land in a single 512-channel frame per universe."""
+        a = FixtureBase(1, "a", 2)
+        b = FixtureBase(10, "b", 3)
+        a.values[:] = [10, 300]
+        b.values[:] = [-5, 20.7, 40]
+        dmx = MagicMock()
+
+        PatchBuffer([a, b]).render(dmx)
+
+        dmx.set_channels.assert_called_once()
+        start, frame = dmx.set_channels.call_args.args
+        assert start == 1
+        assert len(frame) == 512
+        assert list(frame[0:2]) == [10, 255]
+        assert list(frame[9:12]) == [0, 20, 40]
+
+    def test_render_flattens_groups(self):
+        """Group children are rendered at their own addresses."""
+        group = FixtureGroup([FixtureBase(1, "a", 1), FixtureBase(5, "b", 1)])
+        group.fixtures[0].values[0] = 11
+        group.fixtures[1].values[0] = 22
+        dmx = MagicMock()
+
+        PatchBuffer([group]).render(dmx)
+
+        _, frame = dmx.set_channels.call_args.args
+        assert frame[0] == 11
+        assert frame[4] == 22
+
+    def test_render_drops_channels_past_512(self):
+        """Channels beyond the end of the universe are not written."""
+        fixture = FixtureBase(511, "edge", 4)
+        fixture.values[:] = [1, 2, 3, 4]
+        dmx = MagicMock()
+
+        PatchBuffer([fixture]).render(dmx)
+
+        _, frame = dmx.set_channels.call_args.args
+        assert list(frame[510:512]) == [1, 2]
+
+    def test_render_skips_unchanged_frames(self):
+        """An idle patch does not rewrite the controller's frame."""
+        fixture = FixtureBase(1, "a", 2)
+        buffer = PatchBuffer([fixture])
+        dmx = MagicMock()
+
+        buffer.render(dmx)
+        buffer.render(dmx)
+        assert dmx.set_channels.call_count == 1
+
+        fixture.values[1] = 99
+        buffer.render(dmx)
+        assert dmx.set_channels.call_count == 2
+        _, frame = dmx.set_channels.call_args.args
+        assert frame[1] == 99
+
+    def test_render_fixture_spans_only(self):
+        """Without full frames, each fixture writes just its own channels."""
+        a = FixtureBase(3, "a", 2)
+        b = FixtureBase(40, "b", 1)
+        a.values[:] = [7, 300]
+        b.values[0] = 9
+        dmx = MagicMock()
+
+        PatchBuffer([FixtureGroup([a, b])], full_frame=False).render(dmx)
+
+        start, values = dmx.set_channels.call_args.args
+        assert start == 3
+        assert list(values) == [7, 255]
+        dmx.set_channel.assert_called_once_with(40, 9, universe=b.universe)
+
+    def test_venue_patches_render(self):
+        """Every venue patch renders through a PatchBuffer."""
+        for venue in venues:
+            dmx = MagicMock()
+            PatchBuffer([get_manual_group(venue)] + venue_patches[venue]).render(dmx)
+            assert dmx.set_channels.called
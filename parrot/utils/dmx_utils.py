@@ -1,144 +1,497 @@
 from DMXEnttecPro import Controller
-import math
+import logging
 import os
 import enum
+import functools
+import re
+import socket
+import sys
+import threading
+import time
+
+import numpy as np
 
 from beartype import beartype
 from parrot.utils.mock_controller import MockDmxController
 from .math import clamp
 from stupidArtnet import StupidArtnet
 
+logger = logging.getLogger(__name__)
 
-class Universe(enum.Enum):
-    """DMX Universe enumeration"""
 
-    default = "art1"  # Maps to Entec controller
+class Universe(enum.IntEnum):
+    """DMX Universe enumeration
+
+    An IntEnum so controller maps keyed by universe hash and compare as ints.
+    """
+
+    default = 1  # Maps to Entec controller
+
+    @property
+    def label(self):
+        """Name used in fixture ids, e.g. art1"""
+        return f"art{self.value}"
 
 
-@beartype
 def dmx_clamp(n):
-    if math.isnan(n):
+    if type(n) is int:
+        return 0 if n < 0 else 255 if n > 255 else n
+    # n != n is the NaN check, without a math.isnan call
+    if n != n or n <= 0:
         return 0
-    return int(clamp(n, 0, 255))
+    if n >= 255:
+        return 255
+    return int(n)
+
+
+def dmx_clamp_array(values):
+    """Clamp a numeric array to a uint8 DMX array in vectorized calls.
+
+    uint8 input is already in range and is returned as is; float input also
+    has NaN mapped to 0, matching dmx_clamp.
+    """
+    values = np.asarray(values)
+    if values.dtype == np.uint8:
+        return values
+    if values.dtype.kind == "f":
+        values = np.clip(values, 0, 255)
+        np.nan_to_num(values, copy=False)
+    else:
+        values = np.clip(values, 0, 255)
+    return values.astype(np.uint8, copy=False)
+
+
+def dmx_clamp_bytes(buf):
+    """Fit an already-uint8 frame to exactly one 512 channel universe."""
+    if len(buf) == 512:
+        return bytes(buf)
+    return bytes(buf[:512]).ljust(512, b"\x00")
 
 
-@beartype
 def dmx_clamp_list(items):
-    return [int(clamp(item, 0, 255)) for item in items]
+    if isinstance(items, (bytes, bytearray)):
+        return list(items)
+    return dmx_clamp_array(np.asarray(items, dtype=np.float64)).tolist()
+
+
+def scatter_universe(values_flat, sources, targets, out_buf):
+    """Clamp values_flat and scatter values_flat[sources] into out_buf[targets].
+
+    sources/targets are precomputed index arrays (see PatchBuffer), so a whole
+    universe is clamped and written in a handful of vectorized calls.
+    """
+    np.clip(values_flat, 0, 255, out=values_flat)
+    np.nan_to_num(values_flat, copy=False)
+    out_buf[targets] = values_flat[sources]
+    return out_buf
 
 
 usb_path = "/dev/cu.usbserial-EN419206"
 
+# Paths tried before any saved or scanned port: ENTEC_USB_PATH (best a stable
+# /dev/serial/by-id/... link on Linux), the hardcoded path, and on macOS
+# its tty variant
+_USB_PATH_CANDIDATES = tuple(
+    dict.fromkeys(
+        path
+        for path in (
+            os.environ.get("ENTEC_USB_PATH"),
+            usb_path,
+            (
+                usb_path.replace("/dev/cu.", "/dev/tty.")
+                if sys.platform == "darwin"
+                else None
+            ),
+        )
+        if path
+    )
+)
+
+# USB vendor/product ids in a port's hwid, in both the pyserial
+# "USB VID:PID=0403:6001" and Windows "FTDIBUS\VID_0403+PID_6001" forms
+_HWID_RE = re.compile(r"VID(?::PID=|_)([0-9A-F]{4})(?::|[&+]PID_)([0-9A-F]{4})", re.I)
+_KNOWN_DMX_USB_IDS = {("0403", "6001"): "FTDI/Entec"}
+# Fallback substrings looked for in a port's description/hwid/manufacturer/product
+_ENTEC_KEYWORDS = ("enttec", "entec", "dmx", "ftdi")
+
+# Serial device name prefixes under /dev, in order of preference
+_DEV_PREFIXES_DARWIN = ("cu.usbserial", "cu.usbmodem", "tty.usbserial", "tty.usbmodem")
+_DEV_PREFIXES_LINUX = ("ttyUSB", "ttyACM")
+
+
+def _scan_dev(prefixes, dev_dir="/dev"):
+    """First device in dev_dir matching prefixes, preferring earlier prefixes"""
+    try:
+        with os.scandir(dev_dir) as entries:
+            names = [e.name for e in entries if e.name.startswith(prefixes)]
+    except OSError:
+        return None
+    for prefix in prefixes:
+        for name in sorted(names):
+            if name.startswith(prefix):
+                return os.path.join(dev_dir, name)
+    return None
+
+
+# Reuse a discovered port for a few seconds (e.g. across reconnect attempts),
+# and remember the last good one across runs so startup can skip the scan
+ENTEC_PORT_CACHE_TTL = 5.0
+entec_port_cache_file = os.path.join(
+    os.path.expanduser("~"), ".cache", "parrot", "entec_port"
+)
+_port_cache = {"path": None, "ts": 0.0}
+
+
+def _remember_entec_port(path):
+    _port_cache["path"] = path
+    _port_cache["ts"] = time.monotonic()
+    try:
+        os.makedirs(os.path.dirname(entec_port_cache_file), exist_ok=True)
+        with open(entec_port_cache_file, "w") as f:
+            f.write(path)
+    except OSError:
+        pass
+
+
+def _load_saved_entec_port():
+    try:
+        with open(entec_port_cache_file) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _configured_entec_port():
+    """First of the configured/hardcoded paths that exists, if any"""
+    for path in _USB_PATH_CANDIDATES:
+        try:
+            os.stat(path)
+        except OSError:
+            continue
+        return path
+    return None
+
 
 @beartype
-def find_entec_port():
-    import os
-    import glob
+def find_entec_port(force_rescan: bool = False):
+    """Find the Entec serial port, reusing a recent or saved result unless force_rescan"""
+    # Configured paths always win, including over a port saved by an earlier run
+    path = _configured_entec_port()
+    if path is not None:
+        print(f"Found Entec port at configured path: {path}")
+        return path
+
+    if not force_rescan:
+        cached = _port_cache["path"]
+        if (
+            cached is not None
+            and time.monotonic() - _port_cache["ts"] < ENTEC_PORT_CACHE_TTL
+            and os.path.exists(cached)
+        ):
+            return cached
+
+        saved = _load_saved_entec_port()
+        if saved is not None and os.path.exists(saved):
+            print(f"Found Entec port at last known path: {saved}")
+            _port_cache["path"] = saved
+            _port_cache["ts"] = time.monotonic()
+            return saved
+
+    path = _scan_entec_port()
+    if path is not None:
+        _remember_entec_port(path)
+    return path
+
+
+@functools.cache
+def _get_list_ports():
+    # Imported on first scan only; it pulls in pyserial's platform backend
     import serial.tools.list_ports
-    import sys
 
-    # First, try the hardcoded path
-    if os.path.exists(usb_path):
-        print(f"Found Entec port at hardcoded path: {usb_path}")
-        return usb_path
+    return serial.tools.list_ports
 
-    # macOS-specific tty fallback
-    if sys.platform == "darwin":
-        tty_path = usb_path.replace("/dev/cu.", "/dev/tty.")
-        if os.path.exists(tty_path):
-            print(f"Found Entec port at tty variant: {tty_path}")
-            return tty_path
 
-    ports = serial.tools.list_ports.comports()
+def _scan_entec_port():
+    ports = _get_list_ports().comports()
     print(f"Scanning {len(ports)} serial ports for Entec DMX controller...")
 
     for port in ports:
-        desc = str(port.description).lower()
-        hwid = str(port.hwid).lower()
-        manufacturer = str(getattr(port, "manufacturer", "")).lower()
-        product = str(getattr(port, "product", "")).lower()
-
-        if "0403" in hwid and "6001" in hwid:
-            print(f"✅ Found FTDI device at {port.device}")
-            return port.device
-
-        if any(
-            keyword in desc
-            or keyword in hwid
-            or keyword in manufacturer
-            or keyword in product
-            for keyword in ["enttec", "entec", "dmx", "ftdi"]
-        ):
+        hwid = str(port.hwid)
+        match = _HWID_RE.search(hwid)
+        if match:
+            label = _KNOWN_DMX_USB_IDS.get(
+                (match.group(1).upper(), match.group(2).upper())
+            )
+            if label is not None:
+                print(f"✅ Found {label} device at {port.device}")
+                return port.device
+
+        # One lowercased blob per port; NUL separators keep a keyword from
+        # matching across two fields
+        blob = "\x00".join(
+            (
+                str(port.description),
+                hwid,
+                str(getattr(port, "manufacturer", "")),
+                str(getattr(port, "product", "")),
+            )
+        ).lower()
+
+        if any(keyword in blob for keyword in _ENTEC_KEYWORDS):
             print(f"✅ Found potential Entec device at {port.device}")
             return port.device
 
-    # OS-specific /dev scanning
+    # OS-specific /dev scanning, one directory listing for all prefixes
     if sys.platform == "darwin":
-        scan_patterns = [
-            "/dev/cu.usbserial*",
-            "/dev/cu.usbmodem*",
-            "/dev/tty.usbserial*",
-            "/dev/tty.usbmodem*",
-        ]
+        prefixes = _DEV_PREFIXES_DARWIN
     else:  # Linux + others
-        scan_patterns = [
-            "/dev/ttyUSB*",
-            "/dev/ttyACM*",
-        ]
-
-    print(f"Scanning /dev using patterns: {scan_patterns}")
-    for pattern in scan_patterns:
-        for path in glob.glob(pattern):
-            if os.path.exists(path):
-                print(f"✅ Found device at {path}")
-                return path
+        prefixes = _DEV_PREFIXES_LINUX
+
+    print(f"Scanning /dev for devices starting with: {prefixes}")
+    path = _scan_dev(prefixes)
+    if path is not None:
+        print(f"✅ Found device at {path}")
+        return path
 
     print("❌ No Entec DMX controller port found")
     return None
 
 
-class ArtNetController:
-    """Standalone Art-Net controller with DMX controller interface"""
+ARTNET_PORT = 6454
+# ArtPoll: id, OpPoll (0x2000, little endian), protocol version 14, flags, priority
+_ARTPOLL_PACKET = b"Art-Net\x00" + bytes([0x00, 0x20, 0, 14, 0, 0])
+_ARTPOLLREPLY_PREFIX = b"Art-Net\x00" + bytes([0x00, 0x21])
+
+
+def _artdmx_header(universe, length=512):
+    """18-byte ArtDmx header; only the sequence byte (12) changes per frame"""
+    return bytes(
+        [*b"Art-Net\x00", 0x00, 0x50, 0, 14, 0, 0]
+        + [universe & 0xFF, (universe >> 8) & 0xFF]
+        + [(length >> 8) & 0xFF, length & 0xFF]
+    )
+
+
+def discover_artnet_nodes(timeout=1.0, broadcast_ip="255.255.255.255"):
+    """Broadcast an ArtPoll and return the IPs of nodes that reply"""
+    nodes = []
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            # Nodes reply to the Art-Net port, not to our source port
+            sock.bind(("", ARTNET_PORT))
+            sock.sendto(_ARTPOLL_PACKET, (broadcast_ip, ARTNET_PORT))
+            deadline = time.monotonic() + timeout
+            while (remaining := deadline - time.monotonic()) > 0:
+                sock.settimeout(remaining)
+                try:
+                    data, (ip, _) = sock.recvfrom(1024)
+                except socket.timeout:
+                    break
+                if data.startswith(_ARTPOLLREPLY_PREFIX) and ip not in nodes:
+                    nodes.append(ip)
+    except OSError as e:
+        logger.warning(f"Art-Net discovery failed: {e}")
+    return nodes
 
-    def __init__(self, artnet_ip="127.0.0.1", artnet_universe=0):
+
+class ArtNetController:
+    """Standalone Art-Net controller with DMX controller interface
+
+    With a refresh_rate, frames are sent from a background thread at that
+    fixed rate (ArtDmx nodes expect a steady stream, and moving heads get
+    jerky when frames arrive at the render loop's uneven rate); channel
+    writes just update the packet and submit() is a no-op. Without one,
+    each submit() sends a frame.
+    """
+
+    def __init__(
+        self,
+        artnet_ip="127.0.0.1",
+        artnet_universe=0,
+        refresh_rate=None,
+        trust_channels=False,
+    ):
+        # StupidArtnet provides the (broadcast-enabled) socket; the packet
+        # itself is kept here, preformatted, so a frame is one sendto
         self.artnet = StupidArtnet(artnet_ip, artnet_universe, 512, 30, True, True)
-        self.dmx_data = [0] * 512
+        self._address = (artnet_ip, ARTNET_PORT)
+        self._packet = bytearray(_artdmx_header(artnet_universe)) + bytearray(512)
+        # Channel writes land directly in the packet's DMX payload
+        self.dmx_data = memoryview(self._packet)[18:]
+        self._dmx_view = np.frombuffer(self._packet, dtype=np.uint8, offset=18)
+
+        # Known node IPs; when set, frames are unicast to each instead of broadcast
+        self._targets: list[str] = []
+
+        # Held by channel writes and by the send thread's snapshot, so a frame
+        # never goes out half-written (numpy can drop the GIL mid-copy)
+        self._lock = threading.Lock()
+
+        # Callers that only ever write channels 1-512 (e.g. a fixed patch)
+        # can skip the per-write range check
+        if trust_channels:
+            self.set_channel = self._set_channel_unchecked
+
+        self._stop = threading.Event()
+        self._thread = None
+        if refresh_rate:
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(1.0 / refresh_rate,),
+                name=f"artnet-{artnet_ip}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def set_targets(self, ips):
+        self._targets = list(ips)
+
+    def discover_nodes(self, timeout=1.0):
+        """ArtPoll for nodes and unicast to any that reply"""
+        self.set_targets(discover_artnet_nodes(timeout))
+        return self._targets
 
     def set_channel(self, channel, value, universe=None):
         # Channels are 1-indexed for DMX, 0-indexed for Art-Net
         # universe parameter is accepted for compatibility but not used (single universe controller)
         if 1 <= channel <= 512:
-            self.dmx_data[channel - 1] = int(value)
+            with self._lock:
+                self.dmx_data[channel - 1] = dmx_clamp(value)
+
+    def _set_channel_unchecked(self, channel, value, universe=None):
+        with self._lock:
+            self.dmx_data[channel - 1] = dmx_clamp(value)
+
+    def set_channels(self, start_channel, values, universe=None):
+        # Bulk write of consecutive channels starting at start_channel (1-indexed)
+        start = start_channel - 1
+        end = min(start + len(values), 512)
+        if start < 0 or start >= end:
+            return
+        # uint8 frames (PatchBuffer) pass through dmx_clamp_array untouched
+        clamped = dmx_clamp_array(values[: end - start])
+        with self._lock:
+            self._dmx_view[start:end] = clamped
+
+    def send_to(self, address, packet=None):
+        try:
+            self.artnet.socket_client.sendto(
+                self._packet if packet is None else packet, address
+            )
+        except OSError as e:
+            logger.warning(f"Art-Net send to {address[0]} failed: {e}")
+
+    def _send_frame(self, packet=None):
+        # Sequence 1-255 lets nodes reorder packets; 0 would disable that
+        self._packet[12] = self._packet[12] % 255 + 1
+        if packet is not None:
+            packet[12] = self._packet[12]
+        if self._targets:
+            for ip in self._targets:
+                self.send_to((ip, ARTNET_PORT), packet)
+        else:
+            self.send_to(self._address, packet)
+        # Formatting the frame is expensive, so only do it when it will be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("DMX frame: %s", self.dmx_data.hex())
+
+    def _run(self, period):
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            # Snapshot under the write lock, then send without holding it
+            with self._lock:
+                packet = bytearray(self._packet)
+            self._send_frame(packet)
+            next_tick += period
+            now = time.monotonic()
+            if next_tick < now - period:
+                # Fell behind (e.g. the machine slept); don't burst to catch up
+                next_tick = now
+            self._stop.wait(max(0.0, next_tick - now))
 
     def submit(self):
-        self.artnet.set(self.dmx_data)
-        self.artnet.show()
-        print(f"Setting channel {self.dmx_data}")
+        if self._thread is None:
+            self._send_frame()
+
+    def close(self):
+        """Stop the background send thread, if any, and close the socket"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.artnet.close()
+
+
+def _bulk_writer(controller):
+    """controller.set_channels, or a set_channel loop if it has none (e.g. the Entec)"""
+    set_channels = getattr(controller, "set_channels", None)
+    if set_channels is not None:
+        return set_channels
+    set_channel = controller.set_channel
+
+    def set_channels(start_channel, values, universe=None):
+        values = dmx_clamp_list(values)[: max(0, 513 - start_channel)]
+        for channel, value in enumerate(values, start_channel):
+            set_channel(channel, value)
+
+    return set_channels
+
 
 class SwitchController:
     def __init__(self, controller_map):
         self.controller_map = controller_map
+        self._bind_controllers()
+
+    def add_controller(self, universe, controller):
+        self.controller_map[universe] = controller
+        self._bind_controllers()
+
+    def _bind_controllers(self):
+        # Bound methods per universe, so each write is one dict get and a call
+        self._set_channel = {
+            u: c.set_channel for u, c in self.controller_map.items() if c
+        }
+        self._set_channels = {
+            u: _bulk_writer(c) for u, c in self.controller_map.items() if c
+        }
+        self._submits = tuple(c.submit for c in self.controller_map.values())
 
     def set_channel(self, channel, value, universe=Universe.default):
-        controller = self.controller_map.get(universe)
-        if controller:
-            controller.set_channel(channel, value)
+        set_channel = self._set_channel.get(universe)
+        if set_channel is not None:
+            set_channel(channel, value)
+
+    def set_channels(self, start_channel, values, universe=Universe.default):
+        set_channels = self._set_channels.get(universe)
+        if set_channels is not None:
+            set_channels(start_channel, values)
 
     def submit(self):
-        for controller in self.controller_map.values():
-            controller.submit()
+        for submit in self._submits:
+            submit()
 
 # Per-venue Art-Net configuration
 # Format: {venue: {"ip": "x.x.x.x", "universe": 0}}
+# Optional: "targets": ["x.x.x.x", ...] to unicast to known nodes, or
+# "discover": True to find them with ArtPoll at startup
 artnet_config = {
     "two_heads_only": {"ip": "127.0.0.1", "universe": 0},
 }
 
 
+def _env_flag(name):
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+# Read once at import; MOCK_DMX=1/true/yes/on swaps the Entec for a mock
+_MOCK_DMX = _env_flag("MOCK_DMX")
+
+
 @beartype
 def get_entec_controller():
     """Get Entec controller or mock if not available"""
-    if os.environ.get("MOCK_DMX", False) != False:
+    if _MOCK_DMX:
         return MockDmxController()
 
     # Try to find the Entec port
@@ -179,26 +532,67 @@ def get_entec_controller():
         return MockDmxController()
 
 
-@beartype
 @beartype
 def get_controller(venue=None):
-    controller_map = {}
-    switch_controller = SwitchController(controller_map)
-
-    # Always create Art-Net as the default universe
+    venue_name = None
     if venue is not None:
         venue_name = venue.name if hasattr(venue, "name") else str(venue)
+    if venue_name in _controllers:
+        return _controllers[venue_name]
+
+    switch_controller = SwitchController({})
+
+    # Always create Art-Net as the default universe
+    if venue_name is not None:
         config = artnet_config.get(venue_name)
         if config:
             print(f"Art-Net enabled for {venue_name}: {config['ip']} Universe {config['universe']}")
-            artnet = ArtNetController(config["ip"], config["universe"])
+            artnet = _make_artnet(
+                config["ip"],
+                config["universe"],
+                tuple(config.get("targets") or ()),
+                bool(config.get("discover")),
+            )
         else:
             print(f"No Art-Net config for venue {venue_name}, using localhost Art-Net")
-            artnet = ArtNetController("127.0.0.1", 0)
+            artnet = _make_artnet("127.0.0.1", 0)
     else:
-        artnet = ArtNetController("127.0.0.1", 0)
+        artnet = _make_artnet("127.0.0.1", 0)
 
-    controller_map[Universe.default] = artnet
+    switch_controller.add_controller(Universe.default, artnet)
 
+    _controllers[venue_name] = switch_controller
     return switch_controller
 
+
+# Controllers are shared per venue and Art-Net node, so asking again doesn't
+# open another socket. reset_controller_cache() closes and drops them (tests,
+# hot reload).
+_controllers = {}
+_artnet_controllers = {}
+
+
+# Fixed DMX frame rate for Art-Net output, the usual ~44 Hz DMX refresh
+ARTNET_REFRESH_HZ = 44.0
+
+
+def _make_artnet(ip, universe, targets=(), discover=False):
+    # Keyed on the unicast setup too, so one venue's targets never change
+    # where another venue's frames go
+    key = (ip, universe, targets, discover)
+    artnet = _artnet_controllers.get(key)
+    if artnet is None:
+        artnet = ArtNetController(ip, universe, refresh_rate=ARTNET_REFRESH_HZ)
+        if targets:
+            artnet.set_targets(targets)
+        elif discover:
+            print(f"Art-Net nodes found: {artnet.discover_nodes()}")
+        _artnet_controllers[key] = artnet
+    return artnet
+
+
+def reset_controller_cache():
+    for artnet in _artnet_controllers.values():
+        artnet.close()
+    _artnet_controllers.clear()
+    _controllers.clear()
@@ -5,5 +5,8 @@ class MockDmxController:
     def set_channel(self, channel, value, universe=None):
         pass
 
+    def set_channels(self, start_channel, values, universe=None):
+        pass
+
     def submit(self):
         pass
@@ -1,20 +1,46 @@
 import pytest
 import os
 import math
+import tempfile
+import time
+import numpy as np
 from unittest.mock import Mock, patch, MagicMock
 from parrot.utils.dmx_utils import (
     dmx_clamp,
+    dmx_clamp_array,
+    dmx_clamp_bytes,
     dmx_clamp_list,
     get_controller,
     get_entec_controller,
     ArtNetController,
     SwitchController,
     Universe,
+    find_entec_port,
+    reset_controller_cache,
 )
+import parrot.utils.dmx_utils as dmx_utils
 from parrot.utils.mock_controller import MockDmxController
 
 
 class TestDmxUtils:
+    def setup_method(self):
+        reset_controller_cache()
+        # Keep Entec port lookups away from the real ~/.cache and earlier tests
+        dmx_utils._port_cache.update(path=None, ts=0.0)
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self._cache_file_patch = patch.object(
+            dmx_utils,
+            "entec_port_cache_file",
+            os.path.join(self._cache_dir.name, "entec_port"),
+        )
+        self._cache_file_patch.start()
+
+    def teardown_method(self):
+        reset_controller_cache()
+        self._cache_file_patch.stop()
+        self._cache_dir.cleanup()
+        dmx_utils._port_cache.update(path=None, ts=0.0)
+
     def test_dmx_clamp_normal_values(self):
         """Test dmx_clamp with normal values."""
         assert dmx_clamp(0) == 0
@@ -62,27 +88,44 @@ class TestDmxUtils:
         assert dmx_clamp_list(input_list) == expected
 
     def test_dmx_clamp_list_with_nan(self):
-        """Test dmx_clamp_list with NaN values."""
-        # Note: dmx_clamp_list doesn't handle NaN like dmx_clamp does
-        # This test documents the current behavior
-        input_list = [
-            127,
-            255,
-        ]  # Skip NaN for now since it's not handled in the list version
-        expected = [127, 255]
+        """Test dmx_clamp_list maps NaN to 0 like dmx_clamp does."""
+        input_list = [127, float("nan"), 255]
+        expected = [127, 0, 255]
         assert dmx_clamp_list(input_list) == expected
 
+    def test_dmx_clamp_list_bytes(self):
+        """Test dmx_clamp_list passes uint8 bytes straight through."""
+        assert dmx_clamp_list(bytes([0, 128, 255])) == [0, 128, 255]
+
+    def test_dmx_clamp_array(self):
+        """Test dmx_clamp_array clamps float and int arrays to uint8."""
+        result = dmx_clamp_array(np.array([-5.0, float("nan"), 127.7, 300.0]))
+        assert result.dtype == np.uint8
+        assert result.tolist() == [0, 0, 127, 255]
+
+        result = dmx_clamp_array(np.array([-300, 42, 1000], dtype=np.int16))
+        assert result.tolist() == [0, 42, 255]
+
+        frame = np.arange(10, dtype=np.uint8)
+        assert dmx_clamp_array(frame) is frame
+
+    def test_dmx_clamp_bytes(self):
+        """Test dmx_clamp_bytes pads or truncates to one universe."""
+        assert dmx_clamp_bytes(b"\x01\x02") == b"\x01\x02" + bytes(510)
+        assert dmx_clamp_bytes(bytes(range(256)) * 3) == (bytes(range(256)) * 2)
+        assert len(dmx_clamp_bytes(bytearray(512))) == 512
+
     def test_dmx_clamp_list_empty_list(self):
         """Test dmx_clamp_list with empty list."""
         assert dmx_clamp_list([]) == []
 
-    @patch.dict(os.environ, {"MOCK_DMX": "true"})
+    @patch.object(dmx_utils, "_MOCK_DMX", True)
     def test_get_entec_controller_mock_environment(self):
         """Test get_entec_controller returns mock when MOCK_DMX is set."""
         controller = get_entec_controller()
         assert isinstance(controller, MockDmxController)
 
-    @patch.dict(os.environ, {}, clear=True)
+    @patch.object(dmx_utils, "_MOCK_DMX", False)
     @patch("parrot.utils.dmx_utils.Controller")
     def test_get_entec_controller_success(self, mock_controller_class):
         """Test get_entec_controller returns real controller when available."""
@@ -94,7 +137,7 @@ class TestDmxUtils:
         assert controller == mock_controller_instance
         mock_controller_class.assert_called_once_with("/dev/cu.usbserial-EN419206")
 
-    @patch.dict(os.environ, {}, clear=True)
+    @patch.object(dmx_utils, "_MOCK_DMX", False)
     @patch("parrot.utils.dmx_utils.Controller")
     def test_get_entec_controller_exception(self, mock_controller_class):
         """Test get_entec_controller falls back to mock when real controller fails."""
@@ -105,13 +148,23 @@ class TestDmxUtils:
         assert isinstance(controller, MockDmxController)
         mock_controller_class.assert_called_once_with("/dev/cu.usbserial-EN419206")
 
-    @patch.dict(os.environ, {"MOCK_DMX": ""})
-    def test_get_entec_controller_empty_mock_env(self):
-        """Test get_entec_controller with empty MOCK_DMX environment variable."""
-        # Empty string is truthy in Python, so it will use mock controller
-        controller = get_entec_controller()
-
-        assert isinstance(controller, MockDmxController)
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("1", True),
+            ("true", True),
+            (" Yes ", True),
+            ("on", True),
+            ("", False),
+            ("0", False),
+            ("false", False),
+            ("no", False),
+        ],
+    )
+    def test_mock_dmx_env_flag(self, value, expected):
+        """Test MOCK_DMX only enables the mock for truthy values."""
+        with patch.dict(os.environ, {"MOCK_DMX": value}):
+            assert dmx_utils._env_flag("MOCK_DMX") is expected
 
     def test_dmx_clamp_type_consistency(self):
         """Test that dmx_clamp always returns int."""
@@ -134,6 +187,15 @@ class TestDmxUtils:
         assert dmx_clamp(0.5) == 0  # int() truncates
         assert dmx_clamp(0.9) == 0
 
+    def test_dmx_clamp_int_and_infinite(self):
+        """Test dmx_clamp's int fast path and infinities."""
+        assert dmx_clamp(-7) == 0
+        assert dmx_clamp(42) == 42
+        assert dmx_clamp(1000) == 255
+        assert dmx_clamp(float("inf")) == 255
+        assert dmx_clamp(float("-inf")) == 0
+        assert dmx_clamp(np.int64(300)) == 255
+
     def test_dmx_clamp_list_preserves_order(self):
         """Test that dmx_clamp_list preserves input order."""
         input_list = [255, 0, 127, 64, 192]
@@ -141,7 +203,7 @@ class TestDmxUtils:
         assert result == [255, 0, 127, 64, 192]
 
     @patch("builtins.print")
-    @patch.dict(os.environ, {}, clear=True)
+    @patch.object(dmx_utils, "_MOCK_DMX", False)
     @patch("parrot.utils.dmx_utils.Controller")
     def test_get_entec_controller_exception_prints_message(
         self, mock_controller_class, mock_print
@@ -169,6 +231,62 @@ class TestDmxUtils:
         # Verify Art-Net data was stored (channel 1 = index 0)
         assert controller.dmx_data[0] == 255
 
+        # Out-of-range values saturate like set_channels, rather than wrap
+        controller.set_channel(2, 256)
+        controller.set_channel(3, -1)
+        controller.set_channel(4, 99.7)
+        assert list(controller.dmx_data[1:4]) == [255, 0, 99]
+
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_artnet_controller_trust_channels(self, mock_artnet_class):
+        """Test trust_channels swaps in the unchecked set_channel."""
+        mock_artnet_class.return_value = Mock()
+
+        controller = ArtNetController("192.168.1.100", 0, trust_channels=True)
+        switch = SwitchController({Universe.default: controller})
+        switch.set_channel(1, 200)
+        switch.set_channel(512, 7)
+
+        assert controller.dmx_data[0] == 200
+        assert controller.dmx_data[511] == 7
+        with pytest.raises(IndexError):
+            controller.set_channel(513, 1)
+
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_artnet_controller_set_channels(self, mock_artnet_class):
+        """Test ArtNetController writes a block of channels in one call."""
+        mock_artnet_class.return_value = Mock()
+
+        controller = ArtNetController("192.168.1.100", 0)
+        controller.set_channels(10, [1, 2, 3])
+
+        assert controller.dmx_data[9] == 1
+        assert controller.dmx_data[10] == 2
+        assert controller.dmx_data[11] == 3
+
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_artnet_controller_set_channels_truncates_at_512(self, mock_artnet_class):
+        """Test ArtNetController drops channels past the end of the universe."""
+        mock_artnet_class.return_value = Mock()
+
+        controller = ArtNetController("192.168.1.100", 0)
+        controller.set_channels(511, [7, 8, 9, 10])
+
+        assert len(controller.dmx_data) == 512
+        assert controller.dmx_data[510] == 7
+        assert controller.dmx_data[511] == 8
+
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_artnet_controller_set_channels_writes_packet(self, mock_artnet_class):
+        """Test bulk writes are clamped straight into the preformatted packet."""
+        mock_artnet_class.return_value = Mock()
+
+        controller = ArtNetController("192.168.1.100", 0)
+        controller.set_channels(1, np.array([-3.0, 300.0, float("nan"), 12.9]))
+        controller.set_channels(5, np.array([9, 8], dtype=np.uint8))
+
+        assert list(controller._packet[18:24]) == [0, 255, 0, 12, 9, 8]
+
     @patch("parrot.utils.dmx_utils.StupidArtnet")
     def test_artnet_controller_submit(self, mock_artnet_class):
         """Test ArtNetController correctly submits to Art-Net."""
@@ -185,16 +303,98 @@ class TestDmxUtils:
         # Submit
         controller.submit()
 
-        # Verify Art-Net was updated and shown
-        mock_artnet.set.assert_called_once()
-        mock_artnet.show.assert_called_once()
+        # Verify one preformatted ArtDmx packet was sent to the node
+        mock_artnet.socket_client.sendto.assert_called_once()
+        packet, address = mock_artnet.socket_client.sendto.call_args.args
+        assert address == ("192.168.1.100", 6454)
 
-        # Verify the data sent to Art-Net
-        sent_data = mock_artnet.set.call_args[0][0]
+        # Verify the data sent to Art-Net, after the 18-byte header
+        sent_data = bytes(packet)[18:]
         assert sent_data[0] == 255  # Channel 1
         assert sent_data[9] == 128  # Channel 10
         assert sent_data[511] == 64  # Channel 512
 
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_artnet_controller_sequence_increments(self, mock_artnet_class):
+        """Test the ArtDmx sequence byte counts 1-255 and skips 0."""
+        mock_artnet_class.return_value = Mock()
+        controller = ArtNetController("192.168.1.100", 0)
+
+        sequences = []
+        for _ in range(256):
+            controller.submit()
+            sequences.append(controller._packet[12])
+        assert sequences[:3] == [1, 2, 3]
+        assert sequences[254:] == [255, 1]
+
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_artnet_controller_sends_at_refresh_rate(self, mock_artnet_class):
+        """Test a refresh_rate sends frames from a background thread."""
+        mock_artnet = Mock()
+        mock_artnet_class.return_value = mock_artnet
+        sendto = mock_artnet.socket_client.sendto
+
+        controller = ArtNetController("192.168.1.100", 0, refresh_rate=200)
+        try:
+            controller.set_channel(1, 77)
+            controller.submit()  # no-op; the thread owns the cadence
+            deadline = time.monotonic() + 2.0
+            while time.monotonic() < deadline:
+                if any(bytes(c.args[0])[18] == 77 for c in sendto.call_args_list):
+                    break
+                time.sleep(0.01)
+        finally:
+            controller.close()
+
+        assert any(bytes(c.args[0])[18] == 77 for c in sendto.call_args_list)
+        assert not controller._thread.is_alive()
+        sent = sendto.call_count
+        time.sleep(0.05)
+        assert sendto.call_count == sent
+
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_artnet_controller_send_thread_waits_for_writes(self, mock_artnet_class):
+        """Test the send thread doesn't snapshot a frame while a write holds the lock."""
+        mock_artnet = Mock()
+        mock_artnet_class.return_value = mock_artnet
+        sendto = mock_artnet.socket_client.sendto
+
+        controller = ArtNetController("192.168.1.100", 0, refresh_rate=200)
+        try:
+            with controller._lock:
+                time.sleep(0.02)  # let a frame already snapshotted go out
+                sendto.reset_mock()
+                time.sleep(0.05)
+                assert sendto.call_count == 0
+            deadline = time.monotonic() + 2.0
+            while sendto.call_count == 0 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            controller.close()
+        assert sendto.call_count > 0
+
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_artnet_controller_unicasts_to_targets(self, mock_artnet_class):
+        """Test ArtNetController sends one ArtDmx packet per known node."""
+        mock_artnet = Mock()
+        mock_artnet_class.return_value = mock_artnet
+
+        controller = ArtNetController("192.168.1.100", 1)
+        controller.set_targets(["10.0.0.5", "10.0.0.6"])
+        controller.set_channel(1, 42)
+        controller.submit()
+
+        sendto = mock_artnet.socket_client.sendto
+        assert [c.args[1] for c in sendto.call_args_list] == [
+            ("10.0.0.5", 6454),
+            ("10.0.0.6", 6454),
+        ]
+        packet = bytes(sendto.call_args.args[0])
+        assert packet[:8] == b"Art-Net\x00"
+        assert packet[14:16] == bytes([1, 0])  # universe, low byte first
+        assert len(packet) == 18 + 512
+        assert packet[18] == 42
+
     @patch("parrot.utils.dmx_utils.StupidArtnet")
     def test_artnet_controller_initialization(self, mock_artnet_class):
         """Test ArtNetController initialization."""
@@ -254,7 +454,101 @@ class TestDmxUtils:
         mock_controller1.submit.assert_called_once()
         mock_controller2.submit.assert_called_once()
 
-    @patch.dict(os.environ, {"MOCK_DMX": "true"})
+    @patch.object(dmx_utils, "_MOCK_DMX", True)
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_get_controller_is_shared_per_venue(self, mock_artnet_class):
+        """Test repeated get_controller calls reuse controllers and sockets."""
+        venue = Mock()
+        venue.name = "two_heads_only"
+        other = Mock()
+        other.name = "some_other_venue"
+
+        controller = get_controller(venue)
+        assert get_controller(venue) is controller
+        # Both venues end up on localhost universe 0 and share one Art-Net node
+        get_controller(other)
+        assert mock_artnet_class.call_count == 1
+
+        reset_controller_cache()
+        assert get_controller(venue) is not controller
+        assert mock_artnet_class.call_count == 2
+
+    @patch.object(dmx_utils, "_MOCK_DMX", True)
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_get_controller_keeps_targets_per_venue(self, mock_artnet_class):
+        """Test a venue's unicast targets don't leak into another venue on the same node."""
+        venue = Mock()
+        venue.name = "unicast_venue"
+        other = Mock()
+        other.name = "some_other_venue"
+
+        with patch.dict(
+            dmx_utils.artnet_config,
+            {
+                "unicast_venue": {
+                    "ip": "127.0.0.1",
+                    "universe": 0,
+                    "targets": ["10.0.0.5"],
+                }
+            },
+        ):
+            unicast = get_controller(venue).controller_map[Universe.default]
+            broadcast = get_controller(other).controller_map[Universe.default]
+
+        assert unicast is not broadcast
+        assert unicast._targets == ["10.0.0.5"]
+        assert broadcast._targets == []
+
+    @patch.object(dmx_utils, "_MOCK_DMX", True)
+    @patch("parrot.utils.dmx_utils.StupidArtnet")
+    def test_reset_controller_cache_closes_artnet(self, mock_artnet_class):
+        """Test resetting the cache stops every Art-Net send thread and socket."""
+        artnet = get_controller().controller_map[Universe.default]
+        assert artnet._thread.is_alive()
+
+        reset_controller_cache()
+        assert not artnet._thread.is_alive()
+        artnet.artnet.close.assert_called_once()
+
+    def test_universe_is_int_keyed(self):
+        """Test universes behave as ints and keep the art label used in fixture ids."""
+        assert Universe.default == 1
+        assert Universe.default.label == "art1"
+
+        controller = Mock()
+        switch = SwitchController({1: controller})
+        switch.set_channel(3, 9, universe=Universe.default)
+        controller.set_channel.assert_called_once_with(3, 9)
+
+    def test_switch_controller_add_controller(self):
+        """Test controllers added after construction receive writes and submits."""
+        switch = SwitchController({})
+        switch.set_channel(1, 10, universe=Universe.default)
+
+        controller = Mock()
+        switch.add_controller(Universe.default, controller)
+        switch.set_channel(1, 10, universe=Universe.default)
+        switch.set_channels(5, [1, 2], universe=Universe.default)
+        switch.submit()
+
+        controller.set_channel.assert_called_once_with(1, 10)
+        controller.set_channels.assert_called_once_with(5, [1, 2])
+        controller.submit.assert_called_once()
+        assert switch.controller_map == {Universe.default: controller}
+
+    def test_switch_controller_bulk_write_without_set_channels(self):
+        """Test controllers with only set_channel (e.g. the Entec) get bulk writes one channel at a time."""
+        controller = Mock(spec=["set_channel", "submit"])
+        switch = SwitchController({Universe.default: controller})
+
+        switch.set_channels(511, np.array([7, 300, 9], dtype=np.float64))
+
+        assert controller.set_channel.call_args_list == [
+            ((511, 7),),
+            ((512, 255),),
+        ]
+
+    @patch.object(dmx_utils, "_MOCK_DMX", True)
     def test_get_controller_no_venue(self):
         """Test get_controller without venue returns SwitchController with default universe only."""
         controller = get_controller()
@@ -262,7 +556,7 @@ class TestDmxUtils:
         assert Universe.default in controller.controller_map
         assert Universe.art1 not in controller.controller_map
 
-    @patch.dict(os.environ, {"MOCK_DMX": "true"})
+    @patch.object(dmx_utils, "_MOCK_DMX", True)
     @patch("parrot.utils.dmx_utils.StupidArtnet")
     def test_get_controller_with_configured_venue(self, mock_artnet_class):
         """Test get_controller with configured venue returns SwitchController with both universes."""
@@ -285,7 +579,7 @@ class TestDmxUtils:
             "192.168.100.113", 0, 512, 30, True, True
         )
 
-    @patch.dict(os.environ, {"MOCK_DMX": "true"})
+    @patch.object(dmx_utils, "_MOCK_DMX", True)
     def test_get_controller_with_unconfigured_venue(self):
         """Test get_controller with unconfigured venue returns SwitchController with default universe only."""
         mock_venue = Mock()
@@ -297,3 +591,126 @@ class TestDmxUtils:
         assert isinstance(controller, SwitchController)
         assert Universe.default in controller.controller_map
         assert Universe.art1 not in controller.controller_map
+
+
+@patch.object(dmx_utils, "_USB_PATH_CANDIDATES", ())
+class TestFindEntecPort:
+    def setup_method(self):
+        dmx_utils._port_cache.update(path=None, ts=0.0)
+
+    def teardown_method(self):
+        dmx_utils._port_cache.update(path=None, ts=0.0)
+
+    def test_scan_result_is_cached_and_saved(self, tmp_path):
+        """A found port is reused without rescanning and written to the cache file."""
+        cache_file = tmp_path / "entec_port"
+        with patch.object(
+            dmx_utils, "entec_port_cache_file", str(cache_file)
+        ), patch.object(
+            dmx_utils, "_scan_entec_port", return_value=str(tmp_path)
+        ) as scan:
+            assert find_entec_port() == str(tmp_path)
+            assert find_entec_port() == str(tmp_path)
+            assert scan.call_count == 1
+
+            find_entec_port(force_rescan=True)
+            assert scan.call_count == 2
+
+        assert cache_file.read_text() == str(tmp_path)
+
+    def test_saved_port_is_used_before_scanning(self, tmp_path):
+        """The last known port from a previous run skips the scan if it still exists."""
+        cache_file = tmp_path / "entec_port"
+        cache_file.write_text(str(tmp_path))
+        with patch.object(
+            dmx_utils, "entec_port_cache_file", str(cache_file)
+        ), patch.object(dmx_utils, "_scan_entec_port") as scan:
+            assert find_entec_port() == str(tmp_path)
+            scan.assert_not_called()
+
+    def test_missing_saved_port_triggers_scan(self, tmp_path):
+        """A saved port that no longer exists is ignored."""
+        cache_file = tmp_path / "entec_port"
+        cache_file.write_text(str(tmp_path / "gone"))
+        with patch.object(
+            dmx_utils, "entec_port_cache_file", str(cache_file)
+        ), patch.object(dmx_utils, "_scan_entec_port", return_value=None) as scan:
+            assert find_entec_port() is None
+            scan.assert_called_once()
+
+    def test_prefers_configured_path(self, tmp_path):
+        """An existing configured path wins without scanning serial ports."""
+        device = tmp_path / "by-id-entec"
+        device.touch()
+        candidates = (str(tmp_path / "missing"), str(device))
+        with patch.object(dmx_utils, "_USB_PATH_CANDIDATES", candidates), patch.object(
+            dmx_utils, "_scan_entec_port"
+        ) as scan:
+            assert find_entec_port() == str(device)
+        scan.assert_not_called()
+
+    def test_configured_path_wins_over_saved_port(self, tmp_path):
+        """A port saved by an earlier run doesn't shadow a configured path."""
+        configured = tmp_path / "configured"
+        configured.touch()
+        stale = tmp_path / "stale"
+        stale.touch()
+        cache_file = tmp_path / "entec_port"
+        cache_file.write_text(str(stale))
+        with patch.object(
+            dmx_utils, "entec_port_cache_file", str(cache_file)
+        ), patch.object(dmx_utils, "_USB_PATH_CANDIDATES", (str(configured),)):
+            assert find_entec_port() == str(configured)
+
+
+class TestScanEntecPort:
+    @staticmethod
+    def _port(device, hwid, description="n/a"):
+        port = Mock()
+        port.device = device
+        port.hwid = hwid
+        port.description = description
+        port.manufacturer = None
+        port.product = None
+        return port
+
+    @pytest.mark.parametrize(
+        "hwid",
+        [
+            "USB VID:PID=0403:6001 SER=EN419206 LOCATION=1-1",
+            "FTDIBUS\\VID_0403+PID_6001+EN419206A\\0000",
+            "USB\\VID_0403&PID_6001\\EN419206",
+        ],
+    )
+    def test_matches_known_usb_ids(self, hwid):
+        """FTDI/Entec ports are recognised from their VID/PID in any hwid form."""
+        ports = [
+            self._port("/dev/other", "USB VID:PID=1234:5678"),
+            self._port("/dev/entec", hwid),
+        ]
+        with patch("serial.tools.list_ports.comports", return_value=ports):
+            assert dmx_utils._scan_entec_port() == "/dev/entec"
+
+    def test_ignores_unknown_usb_ids(self):
+        """Ports with other VID/PIDs and no DMX keywords are skipped."""
+        ports = [self._port("/dev/other", "USB VID:PID=0403:6010")]
+        with patch(
+            "serial.tools.list_ports.comports", return_value=ports
+        ), patch.object(dmx_utils, "_scan_dev", return_value=None):
+            assert dmx_utils._scan_entec_port() is None
+
+
+class TestScanDev:
+    def test_prefers_earlier_prefixes(self, tmp_path):
+        """Devices matching an earlier prefix win over later ones."""
+        for name in ["ttyACM0", "ttyUSB1", "ttyUSB0", "null"]:
+            (tmp_path / name).touch()
+        assert dmx_utils._scan_dev(("ttyUSB", "ttyACM"), str(tmp_path)) == str(
+            tmp_path / "ttyUSB0"
+        )
+
+    def test_no_match(self, tmp_path):
+        """No matching device returns None, as does a missing directory."""
+        (tmp_path / "null").touch()
+        assert dmx_utils._scan_dev(("ttyUSB",), str(tmp_path)) is None
+        assert dmx_utils._scan_dev(("ttyUSB",), str(tmp_path / "missing")) is None